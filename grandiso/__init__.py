@@ -26,7 +26,6 @@ import networkx as nx
 __version__ = "2.2.0"
 
 
-@lru_cache()
 def _is_node_attr_match(
     motif_node_id: str, host_node_id: str, motif: nx.Graph, host: nx.Graph
 ) -> bool:
@@ -55,7 +54,6 @@ def _is_node_attr_match(
     return True
 
 
-@lru_cache()
 def _is_node_structural_match(
     motif_node_id: str, host_node_id: str, motif: nx.Graph, host: nx.Graph
 ) -> bool:
@@ -63,7 +61,8 @@ def _is_node_structural_match(
     Check if the motif node here is a valid structural match.
 
     Specifically, this requires that a host node has at least the degree as the
-    motif node.
+    motif node. If both graphs are directed, the in-degree and out-degree must
+    each be at least those of the motif node.
 
     Arguments:
         motif_node_id (str): The motif node ID
@@ -75,10 +74,13 @@ def _is_node_structural_match(
         bool: True if the motif node maps to this host node
 
     """
+    if motif.is_directed() and host.is_directed():
+        return host.in_degree(host_node_id) >= motif.in_degree(motif_node_id) and (
+            host.out_degree(host_node_id) >= motif.out_degree(motif_node_id)
+        )
     return host.degree(host_node_id) >= motif.degree(motif_node_id)
 
 
-@lru_cache()
 def _is_edge_attr_match(
     motif_edge_id: Tuple[str, str],
     host_edge_id: Tuple[str, str],
@@ -110,6 +112,559 @@ def _is_edge_attr_match(
     return True
 
 
+class _PerNodeTable(dict):
+    """
+    A table of values for each motif node, each computed on first lookup.
+
+    """
+
+    def __init__(self, compute):
+        """
+        Create an empty table.
+
+        Arguments:
+            compute: A function from a motif node ID to its value
+
+        Returns:
+            None
+
+        """
+        super().__init__()
+        self._compute = compute
+
+    def __missing__(self, motif_node_id: Hashable):
+        value = self[motif_node_id] = self._compute(motif_node_id)
+        return value
+
+
+class _MotifIndex:
+    """
+    Read-only lookup structures for a motif, computed once per search.
+
+    The motif does not change during a call to `find_motifs_iter`, so rather
+    than walking networkx's adjacency views on every backbone expansion, we
+    snapshot the pieces of the motif that the search consults.
+
+    """
+
+    def __init__(self, motif: nx.Graph, interestingness: dict, directed: bool = True):
+        """
+        Build the index for a motif graph.
+
+        Arguments:
+            motif (nx.Graph): The motif graph
+            interestingness (dict): A mapping of motif node IDs to interestingness
+            directed (bool: True): Whether the search is directed
+
+        Returns:
+            None
+
+        """
+        self.interestingness = interestingness
+        self.nodes = tuple(motif.nodes)
+        self.succ = {n: frozenset(motif.adj[n]) for n in self.nodes}
+        if directed:
+            self.pred = {n: frozenset(motif.pred[n]) for n in self.nodes}
+            # Neighbors in either direction, used to count how strongly a
+            # motif node is connected to the current backbone:
+            self.neighbors = {n: self.succ[n] | self.pred[n] for n in self.nodes}
+        else:
+            self.pred = self.succ
+            self.neighbors = self.succ
+        # Predecessors that constrain candidates separately from successors.
+        # In an undirected motif every neighbor is already in `succ`:
+        self.strict_pred = (
+            self.pred if directed else {n: frozenset() for n in self.nodes}
+        )
+        self.directed = directed
+        self.degree = dict(motif.degree)
+        if directed:
+            self.in_degree = dict(motif.in_degree)
+            self.out_degree = dict(motif.out_degree)
+        # Each node attribute is one more constraint on a node's candidates:
+        self.attribute_count = {n: len(motif.nodes[n]) for n in self.nodes}
+        # The first motif node to assign: the most interesting one and, among
+        # equally interesting nodes, the one with the most attributes and then
+        # the highest degree, since it has the fewest candidates in the host.
+        self.seed_node = max(self.nodes, key=self._constraint)
+        # Motif edges incident to each node, and ordered pairs (including
+        # self-pairs) of nodes with NO edge in the motif. Each edge is checked
+        # in the host once both of its endpoints have been assigned, and an
+        # isomorphism may not map any non-edge onto an edge of the host. Both
+        # are built per node on first use, since a single call to
+        # get_next_backbone_candidates only needs one node's entries:
+        self.edges_at = _PerNodeTable(self._edges_at)
+        self.non_edges_at = _PerNodeTable(self._non_edges_at)
+        self._next_node_cache: Dict[frozenset, Hashable] = {}
+
+    def _edges_at(self, motif_node_id: Hashable) -> tuple:
+        edges = [(motif_node_id, v) for v in self.succ[motif_node_id]]
+        if self.directed:
+            edges += [
+                (u, motif_node_id)
+                for u in self.pred[motif_node_id]
+                if u != motif_node_id
+            ]
+        return tuple(edges)
+
+    def _non_edges_at(self, motif_node_id: Hashable) -> tuple:
+        pairs = [
+            (motif_node_id, v) for v in self.nodes if v not in self.succ[motif_node_id]
+        ]
+        if self.directed:
+            pairs += [
+                (u, motif_node_id)
+                for u in self.nodes
+                if u != motif_node_id and u not in self.pred[motif_node_id]
+            ]
+        return tuple(pairs)
+
+    def _constraint(self, motif_node_id: Hashable) -> tuple:
+        return (
+            self.interestingness.get(motif_node_id, 0.0),
+            self.attribute_count[motif_node_id],
+            self.degree[motif_node_id],
+        )
+
+    def next_node(self, backbone: dict) -> Hashable:
+        """
+        Choose the next motif node to assign, given a partial backbone.
+
+        We prefer the unassigned node with the most connections to nodes that
+        are already in the backbone, because these will filter more rapidly to
+        a smaller set of candidates. Ties are broken by interestingness, then by
+        number of attributes, and then by degree.
+
+        The choice depends only upon WHICH motif nodes are assigned (not the
+        host nodes they are assigned to), so it is computed once per set of
+        assigned motif nodes and remembered.
+
+        Arguments:
+            backbone (dict): Mapping of motif node IDs to host graph IDs
+
+        Returns:
+            Hashable: The motif node ID to assign next
+
+        """
+        assigned = frozenset(backbone)
+        if assigned in self._next_node_cache:
+            return self._next_node_cache[assigned]
+
+        best_node = None
+        best_key = None
+        for motif_node_id in self.nodes:
+            if motif_node_id in assigned:
+                continue
+            # How many connections to existing backbone?
+            connections_count = len(self.neighbors[motif_node_id] & assigned)
+            if connections_count == 0:
+                continue
+            key = (connections_count, self._constraint(motif_node_id))
+            if best_key is None or key > best_key:
+                best_node, best_key = motif_node_id, key
+
+        if best_node is None:
+            # A value of 0 everywhere implies that the motif has more than one
+            # connected component (or that the backbone does not overlap the
+            # motif at all).
+            raise ValueError(
+                "Could not find an unassigned motif node connected to the "
+                + "backbone. Is the motif connected?"
+            )
+        self._next_node_cache[assigned] = best_node
+        return best_node
+
+
+class _NodeMatches(dict):
+    """
+    Whether each host node may be assigned to one particular motif node.
+
+    An entry is computed from the node match functions the first time a host
+    node is looked up, and remembered for the rest of the search, so repeat
+    lookups are a single dict access rather than a call to each function.
+
+    """
+
+    def __init__(
+        self, motif_node_id: Hashable, motif: nx.Graph, host: nx.Graph, checks
+    ):
+        """
+        Create an empty table for one motif node.
+
+        Arguments:
+            motif_node_id (Hashable): The motif node ID
+            motif (nx.Graph): The motif graph
+            host (nx.Graph): The host graph
+            checks: Node match functions, all of which must pass
+
+        Returns:
+            None
+
+        """
+        super().__init__()
+        self._motif_node_id = motif_node_id
+        self._motif = motif
+        self._host = host
+        self._checks = checks
+
+    def __missing__(self, host_node_id: Hashable) -> bool:
+        is_match = self[host_node_id] = all(
+            check(self._motif_node_id, host_node_id, self._motif, self._host)
+            for check in self._checks
+        )
+        return is_match
+
+
+def _symmetry_breaking_constraints(
+    motif: nx.Graph, interestingness: dict
+) -> List[Tuple[Hashable, Hashable]]:
+    """
+    Get ordering constraints that pick one match per motif automorphism class.
+
+    Every automorphism of the motif (a relabelling of the motif onto itself
+    that preserves edges and attributes) turns one match into another match
+    on the same host nodes. Constraining the host images of some motif nodes
+    to be in increasing order keeps exactly one of those equivalent matches.
+    The constraints are built from a stabilizer chain: pick a node whose orbit
+    under the remaining automorphisms is non-trivial, require it to map before
+    every other node in its orbit, then consider only the automorphisms that
+    fix it, and repeat. Orbits are found with one isomorphism check per node
+    pair, so the (possibly factorial) automorphism group is never listed.
+
+    Arguments:
+        motif (nx.Graph): The motif graph
+        interestingness (dict): A mapping of motif node IDs to interestingness
+
+    Returns:
+        List[Tuple[Hashable, Hashable]]: Pairs (u, v) such that the host image
+            of u must come before the host image of v
+
+    """
+    matcher = (
+        nx.isomorphism.DiGraphMatcher
+        if motif.is_directed()
+        else nx.isomorphism.GraphMatcher
+    )
+    # The automorphism group of a star or clique has factorial size, so never
+    # list it. Instead, ask whether SOME automorphism fixes the nodes chosen so
+    # far and maps u onto v, by pinning those nodes with a unique label that
+    # no user attribute can collide with:
+    pin = object()
+
+    def is_in_orbit(fixed, u, v):
+        if motif.nodes[u] != motif.nodes[v] or motif.degree[u] != motif.degree[v]:
+            return False
+        source, target = motif.copy(), motif.copy()
+        for n in fixed:
+            source.nodes[n][pin] = target.nodes[n][pin] = n
+        source.nodes[u][pin] = target.nodes[v][pin] = pin
+        return matcher(
+            source,
+            target,
+            node_match=lambda a, b: a == b,
+            edge_match=lambda a, b: a == b,
+        ).is_isomorphic()
+
+    constraints = []
+    fixed = []
+    for u in sorted(motif.nodes, key=lambda n: -interestingness.get(n, 0.0)):
+        orbit = [v for v in motif.nodes if v != u and v not in fixed]
+        orbit = [v for v in orbit if is_in_orbit(fixed, u, v)]
+        if orbit:
+            constraints.extend((u, v) for v in orbit)
+            # Only nodes that some automorphism moves shrink the group:
+            fixed.append(u)
+    return constraints
+
+
+def _neighbor_label_check(groups, node_matches: dict):
+    """
+    Build a node check that compares neighborhoods by node label.
+
+    Each group is a host adjacency (successors or predecessors), a motif node,
+    and the number of the checked motif node's neighbors (in that direction)
+    that have exactly the same requirements as that motif node. A host node
+    passes if, for every group, it has at least that many neighbors that can
+    take the motif node. Otherwise there would not be enough distinct host
+    neighbors to map those motif neighbors onto.
+
+    Arguments:
+        groups: A list of (host adjacency, motif node ID, count) triples
+        node_matches (dict): Node match tables for each motif node
+
+    Returns:
+        Callable: A node match function with the usual signature
+
+    """
+
+    def has_neighbor_labels(motif_node_id, host_node_id, motif, host):
+        for adjacency, neighbor_id, count in groups:
+            matches = node_matches[neighbor_id]
+            found = 0
+            for host_neighbor in adjacency[host_node_id]:
+                if matches[host_neighbor]:
+                    found += 1
+                    if found == count:
+                        break
+            else:
+                return False
+        return True
+
+    return has_neighbor_labels
+
+
+def _seed_candidates(
+    next_node: Hashable,
+    motif: nx.Graph,
+    host: nx.Graph,
+    is_node_structural_match,
+    is_node_attr_match,
+    motif_index: _MotifIndex,
+) -> Generator[Hashable, None, None]:
+    """
+    Yield every host node that could be assigned to the first motif node.
+
+    Arguments:
+        next_node (Hashable): The motif node to assign first
+        motif (nx.Graph): The motif graph
+        host (nx.Graph): The host graph
+        is_node_structural_match: The node structural check
+        is_node_attr_match: The node attribute check, or None to skip it
+        motif_index (_MotifIndex): Precomputed motif lookups
+
+    Returns:
+        Generator[Hashable, None, None]: Candidate host node IDs
+
+    """
+    # Let's return ALL possible node choices for this next_node. To do this
+    # without being an insane person, let's filter on max degree in host:
+    if is_node_structural_match is _is_node_structural_match:
+        # With the default structural check, read every host degree in a
+        # single pass over the degree view rather than calling the check
+        # (and building a new degree view) once per host node. Decide between
+        # in/out-degree and total degree the same way the check itself does:
+        if motif.is_directed() and host.is_directed():
+            min_in_degree = motif.in_degree(next_node)
+            min_out_degree = motif.out_degree(next_node)
+            host_in_degree = host.in_degree
+            for n, out_degree in host.out_degree:
+                if (
+                    out_degree >= min_out_degree
+                    and host_in_degree[n] >= min_in_degree
+                    and (
+                        is_node_attr_match is None
+                        or is_node_attr_match(next_node, n, motif, host)
+                    )
+                ):
+                    yield n
+            return
+        min_degree = motif_index.degree[next_node]
+        for n, degree in host.degree:
+            if degree >= min_degree and (
+                is_node_attr_match is None
+                or is_node_attr_match(next_node, n, motif, host)
+            ):
+                yield n
+        return
+    for n in host.nodes:
+        if (
+            is_node_attr_match is None or is_node_attr_match(next_node, n, motif, host)
+        ) and is_node_structural_match(next_node, n, motif, host):
+            yield n
+
+
+def _extension_candidates(
+    backbone: dict,
+    used_host_nodes: set,
+    next_node: Hashable,
+    host: nx.Graph,
+    directed: bool,
+    node_matches: _NodeMatches,
+    motif_index: _MotifIndex,
+) -> Generator[Hashable, None, None]:
+    """
+    Yield host nodes that could be assigned to `next_node`, given a backbone.
+
+    Candidates are host nodes that are adjacent to the host images of every
+    backbone node that `next_node` is adjacent to in the motif, that are not
+    already used in the backbone, and that pass the node match functions.
+
+    Arguments:
+        backbone (dict): Mapping of motif node IDs to host graph IDs
+        used_host_nodes (set): The host node IDs in `backbone.values()`
+        next_node (Hashable): The motif node to assign next
+        host (nx.Graph): The host graph
+        directed (bool): Whether host and motif are both directed
+        node_matches (_NodeMatches): Node match results for `next_node`
+        motif_index (_MotifIndex): Precomputed motif lookups
+
+    Returns:
+        Generator[Hashable, None, None]: Candidate host node IDs
+
+    """
+    # `next_node` is connected to the current backbone. Each motif edge between
+    # `next_node` and a backbone node must exist in the host graph, which
+    # restricts the candidates to one host neighborhood: the predecessors of
+    # `other`'s host node for an edge (next_node, other), and its successors
+    # for an edge (other, next_node). Undirected searches read both from the
+    # same adjacency, so the direction is settled here, once, rather than for
+    # every edge.
+    # Read neighborhoods from the dicts underlying `host.adj` and `host.pred`
+    # rather than through their views, which wrap every lookup:
+    host_adj = host._adj
+    host_pred = host._pred if directed else host_adj
+    neighborhoods = [
+        host_pred[backbone[other]]
+        for other in motif_index.succ[next_node]
+        if other in backbone
+    ]
+    neighborhoods.extend(
+        host_adj[backbone[other]]
+        for other in motif_index.strict_pred[next_node]
+        if other in backbone
+    )
+
+    # `neighborhoods` now contains one host neighborhood for every edge that
+    # exists in the motif graph, and we must find candidate nodes that are in
+    # all of them.
+
+    # In the worst-case, there is only one neighborhood. This is the worst
+    # case because it means that ALL edges from/to `other` are valid options.
+    if len(neighborhoods) == 1:
+        # :(
+        # Thus, all candidates for motif ID `$next_node` are the keys of
+        # this neighborhood dict.
+        candidate_nodes = neighborhoods[0]
+
+    elif len(neighborhoods) > 1:
+        # This is neato :) It means that there are multiple edges in the host
+        # graph that we can use to downselect the number of candidate nodes.
+        # A candidate must appear in every neighborhood. Rather than building
+        # a set per edge and intersecting them, walk one neighborhood and
+        # probe the others, which are dict-backed and so O(1) to test. Walk
+        # the smallest neighborhood, and probe the next-smallest first: if any
+        # neighborhood is empty, nothing is walked at all.
+        neighborhoods.sort(key=len)
+        first, rest = neighborhoods[0], neighborhoods[1:]
+        candidate_nodes = [c for c in first if all(c in other for other in rest)]
+
+    else:
+        # Somehow you found a node that doesn't have any edges. This is bad.
+        raise ValueError(
+            f"Somehow you found a motif node {next_node} that doesn't have "
+            + "any motif-graph edges. This is bad. (Did you maybe pass an "
+            + "empty backbone to this function?)"
+        )
+
+    for c in candidate_nodes:
+        if c not in used_host_nodes and node_matches[c]:
+            yield c
+
+
+def _is_valid_extension(
+    mapping: dict,
+    next_node: Hashable,
+    motif: nx.Graph,
+    host: nx.Graph,
+    is_edge_attr_match,
+    isomorphisms_only: bool,
+    motif_index: _MotifIndex,
+) -> bool:
+    """
+    Check a mapping that has just had `next_node` assigned.
+
+    Arguments:
+        mapping (dict): Mapping of motif node IDs to host graph IDs, including
+            an assignment for `next_node`
+        next_node (Hashable): The motif node that was most recently assigned
+        motif (nx.Graph): The motif graph
+        host (nx.Graph): The host graph
+        is_edge_attr_match: The edge attribute check, or None to skip it
+        isomorphisms_only (bool): Whether to reject non-induced matches
+        motif_index (_MotifIndex): Precomputed motif lookups
+
+    Returns:
+        bool: True if the mapping may be yielded or extended further
+
+    """
+    # `host._adj` is the plain dict underlying `host.has_edge`; testing
+    # membership in it directly skips a method call per edge.
+    host_adj = host._adj
+
+    # Every motif edge between `next_node` and an assigned node must exist in
+    # the host (with matching attributes). Edges between nodes that were
+    # assigned earlier were checked when the later of their endpoints was
+    # placed, so a mapping that passes here at every step needs no separate
+    # check once it is complete.
+    for motif_u, motif_v in motif_index.edges_at[next_node]:
+        if motif_u in mapping and motif_v in mapping:
+            host_u, host_v = mapping[motif_u], mapping[motif_v]
+            if host_v not in host_adj[host_u] or (
+                is_edge_attr_match is not None
+                and not is_edge_attr_match(
+                    (motif_u, motif_v), (host_u, host_v), motif, host
+                )
+            ):
+                return False
+
+    if isomorphisms_only:
+        # If the motif does NOT have an edge, then NO RESULT may have the
+        # equivalent edge in the host graph. As with edges, only the pairs
+        # involving `next_node` need checking:
+        if any(
+            motif_u in mapping
+            and motif_v in mapping
+            and mapping[motif_v] in host_adj[mapping[motif_u]]
+            for motif_u, motif_v in motif_index.non_edges_at[next_node]
+        ):
+            return False
+
+    return True
+
+
+def _is_valid_mapping(
+    mapping: dict,
+    motif: nx.Graph,
+    host: nx.Graph,
+    is_edge_attr_match,
+    isomorphisms_only: bool,
+    motif_index: _MotifIndex,
+) -> bool:
+    """
+    Check a whole (possibly partial) mapping that was not built by the search.
+
+    Arguments:
+        mapping (dict): Mapping of motif node IDs to host graph IDs
+        motif (nx.Graph): The motif graph
+        host (nx.Graph): The host graph
+        is_edge_attr_match: The edge attribute check, or None to skip it
+        isomorphisms_only (bool): Whether to reject non-induced matches
+        motif_index (_MotifIndex): Precomputed motif lookups
+
+    Returns:
+        bool: True if the mapping may be yielded or extended further
+
+    """
+    if len(set(mapping.values())) != len(mapping):
+        # Two motif nodes share a host node.
+        return False
+    # Replay the mapping one node at a time, as if the search had built it:
+    partial = {}
+    for motif_id, host_id in mapping.items():
+        partial[motif_id] = host_id
+        if not _is_valid_extension(
+            partial,
+            motif_id,
+            motif,
+            host,
+            is_edge_attr_match,
+            isomorphisms_only,
+            motif_index,
+        ):
+            return False
+    return True
+
+
 def get_next_backbone_candidates(
     backbone: dict,
     motif: nx.Graph,
@@ -121,6 +676,7 @@ def get_next_backbone_candidates(
     is_node_attr_match=_is_node_attr_match,
     is_edge_attr_match=_is_edge_attr_match,
     isomorphisms_only: bool = False,
+    motif_index: _MotifIndex = None,
 ) -> List[dict]:
     """
     Get a list of candidate node assignments for the next "step" of this map.
@@ -134,11 +690,21 @@ def get_next_backbone_candidates(
         directed (bool: True): Whether host and motif are both directed
         isomorphisms_only (bool: False): If true, only isomorphisms will be
             returned (instead of all monomorphisms)
+        motif_index (_MotifIndex: None): Precomputed motif lookups. If omitted,
+            this will be computed from `motif` on each call.
 
     Returns:
         List[dict]: A new list of mappings with one additional element mapped
 
     """
+    if motif_index is None:
+        motif_index = _MotifIndex(motif, interestingness, directed)
+    if is_edge_attr_match is _is_edge_attr_match and not any(
+        attrs for _, _, attrs in motif.edges(data=True)
+    ):
+        # The default edge check always passes when no motif edge has
+        # attributes, so skip it (as find_motifs_iter does):
+        is_edge_attr_match = None
 
     # Get a list of the "exploration front" of the motif -- nodes that are not
     # yet assigned in the backbone but are connected to at least one assigned
@@ -155,191 +721,54 @@ def get_next_backbone_candidates(
     # interesting node to start with:
     if next_node is None and len(backbone) == 0:
         # This is the starting-case, where we have NO backbone nodes set yet.
-        next_node = max(
-            interestingness.keys(), key=lambda node: interestingness.get(node, 0.0)
-        )
-        # Let's return ALL possible node choices for this next_node. To do this
-        # without being an insane person, let's filter on max degree in host:
-        for n in host.nodes:
-            if is_node_attr_match(
-                next_node, n, motif, host
-            ) and is_node_structural_match(next_node, n, motif, host):
-                yield {next_node: n}
+        next_node = motif_index.seed_node
+        for c in _seed_candidates(
+            next_node,
+            motif,
+            host,
+            is_node_structural_match,
+            is_node_attr_match,
+            motif_index,
+        ):
+            yield {next_node: c}
         return
 
-    else:
-        _nodes_with_greatest_backbone_count: List[str] = []
-        _greatest_backbone_count = 0
-        for motif_node_id in motif.nodes:
-            if motif_node_id in backbone:
-                continue
-            # How many connections to existing backbone?
-            # Note that this number is certainly greater than or equal to 1,
-            # since a value of 0 would imply that the backbone dict is empty
-            # (which we have already handled) or that the motif has more than
-            # one connected component, which we check for at prep-time.
-            if directed:
-                motif_backbone_connections_count = sum(
-                    [
-                        1
-                        for v in list(
-                            set(motif.adj[motif_node_id]).union(
-                                set(motif.pred[motif_node_id])
-                            )
-                        )
-                        if v in backbone
-                    ]
-                )
-            else:
-                motif_backbone_connections_count = sum(
-                    [1 for v in motif.adj[motif_node_id] if v in backbone]
-                )
-            # If this is the most highly connected node visited so far, then
-            # set it as the next node to explore:
-            if motif_backbone_connections_count > _greatest_backbone_count:
-                _nodes_with_greatest_backbone_count.append(motif_node_id)
-                _greatest_backbone_count = motif_backbone_connections_count
-        # Now we have _node_with_greatest_backbone_count as the best candidate
-        # for `next_node`.
-        next_node = max(
-            _nodes_with_greatest_backbone_count,
-            key=lambda node: interestingness.get(node, 0.0),
-        )
-
-    # Now we have a node `next_node` which we know is connected to the current
-    # backbone. Get all edges between `next_node` and nodes in the backbone,
-    # and verify that they exist in the host graph:
-    # `required_edges` has the form (prev, self, next), with non-values filled
-    # with None. That way we can easily remember and store the roles of the
-    # node IDs in the next step.
-    required_edges = []
-    for other in list(motif.adj[next_node]):
-        if other in backbone:
-            # edge is (next_node, other)
-            required_edges.append((None, next_node, other))
-    if directed:
-        for other in list(motif.pred[next_node]):
-            if other in backbone:
-                # edge is (other, next_node)
-                required_edges.append((other, next_node, None))
-
-    # `required_edges` now contains a list of all edges that exist in the motif
-    # graph, and we must find candidate nodes that have such edges in the host.
-
-    candidate_nodes = []
-
-    # In the worst-case, `required_edges` has length == 1. This is the worst
-    # case because it means that ALL edges from/to `other` are valid options.
-    if len(required_edges) == 1:
-        # :(
-        (source, _, target) = required_edges[0]
-        if directed:
-            if source is not None:
-                # this is a "from" edge:
-                candidate_nodes = list(host.adj[backbone[source]])
-            elif target is not None:
-                # this is a "from" edge:
-                candidate_nodes = list(host.pred[backbone[target]])
+    elif next_node is None:
+        # Otherwise, pick the front node most connected to the backbone:
+        next_node = motif_index.next_node(backbone)
+
+    # Host nodes that are already assigned may not be reused. Build this set
+    # once rather than scanning `backbone.values()` for every candidate:
+    used_host_nodes = set(backbone.values())
+
+    node_checks = (is_node_attr_match, is_node_structural_match)
+    if is_node_attr_match is _is_node_attr_match and not motif.nodes[next_node]:
+        # The default attribute check always passes for a node without
+        # attributes, so skip it (as find_motifs_iter does):
+        node_checks = (is_node_structural_match,)
+    node_matches = _NodeMatches(next_node, motif, host, node_checks)
+    for c in _extension_candidates(
+        backbone, used_host_nodes, next_node, host, directed, node_matches, motif_index
+    ):
+        mapping = {**backbone, next_node: c}
+        if len(mapping) == len(motif):
+            # The backbone may not have been built by this function, so check
+            # the finished mapping in full before returning it:
+            valid = _is_valid_mapping(
+                mapping, motif, host, is_edge_attr_match, isomorphisms_only, motif_index
+            )
         else:
-            candidate_nodes = list(host.adj[backbone[target]])
-        # Thus, all candidates for motif ID `$next_node` are stored in the
-        # candidate_nodes list.
-
-    elif len(required_edges) > 1:
-        # This is neato :) It means that there are multiple edges in the host
-        # graph that we can use to downselect the number of candidate nodes.
-        candidate_nodes_set = set()
-        for source, _, target in required_edges:
-            if directed:
-                if source is not None:
-                    # this is a "from" edge:
-                    candidate_nodes_from_this_edge = host.adj[backbone[source]]
-                # elif target is not None:
-                else:  # target is not None:
-                    # this is a "from" edge:
-                    candidate_nodes_from_this_edge = host.pred[backbone[target]]
-                # else:
-                #     raise AssertionError("Encountered an impossible condition: At least one of source or target must be defined.")
-            else:
-                candidate_nodes_from_this_edge = host.adj[backbone[target]]
-            if len(candidate_nodes_set) == 0:
-                # This is the first edge we're checking, so set the candidate
-                # nodes set to ALL possible candidates.
-                candidate_nodes_set.update(candidate_nodes_from_this_edge)
-            else:
-                candidate_nodes_set = candidate_nodes_set.intersection(
-                    candidate_nodes_from_this_edge
-                )
-        candidate_nodes = list(candidate_nodes_set)
-
-    elif len(required_edges) == 0:
-        # Somehow you found a node that doesn't have any edges. This is bad.
-        raise ValueError(
-            f"Somehow you found a motif node {next_node} that doesn't have "
-            + "any motif-graph edges. This is bad. (Did you maybe pass an "
-            + "empty backbone to this function?)"
-        )
-
-    def tentative_results():
-        for c in candidate_nodes:
-            if (
-                c not in backbone.values()
-                and is_node_attr_match(next_node, c, motif, host)
-                and is_node_structural_match(next_node, c, motif, host)
-            ):
-                yield {**backbone, next_node: c}
-
-    # One last filtering step here. This is to catch the cases where you have
-    # successfully mapped each node, and the final node has some valid
-    # candidate_nodes (and therefore `tentative_results`).
-    # This is important: We must now check that for the assigned nodes, all
-    # edges between them DO exist in the host graph. Otherwise, when we check
-    # in find_motifs that len(motif) == len(mapping), we will discover that the
-    # mapping is "complete" even though we haven't yet checked it at all.
-
-    def monomorphism_candidates():
-        for mapping in tentative_results():
-            if len(mapping) == len(motif):
-                if all(
-                    [
-                        host.has_edge(mapping[motif_u], mapping[motif_v])
-                        and is_edge_attr_match(
-                            (motif_u, motif_v),
-                            (mapping[motif_u], mapping[motif_v]),
-                            motif,
-                            host,
-                        )
-                        for motif_u, motif_v in motif.edges
-                    ]
-                ):
-                    # This is a "complete" match!
-                    yield mapping
-            else:
-                # This is a partial match, so we'll continue building.
-                yield mapping
-
-    if not isomorphisms_only:
-        yield from monomorphism_candidates()
-        return
-
-    # Additionally, if isomorphisms_only == True, we can use this opportunity
-    # to confirm that no spurious edges exist in the induced subgraph:
-    def isomorphism_candidates():
-        for result in monomorphism_candidates():
-            for motif_u, motif_v in itertools.product(result.keys(), result.keys()):
-                # if the motif has this edge, then it doesn't rule any of the
-                # above results out as an isomorphism.
-                # if the motif does NOT have the edge, then NO RESULT may have
-                # the equivalent edge in the host graph:
-                if not motif.has_edge(motif_u, motif_v) and host.has_edge(
-                    result[motif_u], result[motif_v]
-                ):
-                    # this is a violation.
-                    break
-            else:
-                yield result
-
-    yield from isomorphism_candidates()
+            valid = _is_valid_extension(
+                mapping,
+                next_node,
+                motif,
+                host,
+                is_edge_attr_match,
+                isomorphisms_only,
+                motif_index,
+            )
+        if valid:
+            yield mapping
 
 
 def uniform_node_interestingness(motif: nx.Graph) -> dict:
@@ -363,6 +792,7 @@ def find_motifs_iter(
     is_node_structural_match=_is_node_structural_match,
     is_node_attr_match=_is_node_attr_match,
     is_edge_attr_match=_is_edge_attr_match,
+    break_symmetry: bool = False,
 ) -> Generator[dict, None, None]:
     """
     Yield mappings from motif node IDs to host graph IDs.
@@ -385,6 +815,12 @@ def find_motifs_iter(
             list with a single dict item: `[{motifId: hostId}]`.
         isomorphisms_only (bool: False): Whether to return isomorphisms (the
             default is monomorphisms).
+        break_symmetry (bool: False): Whether to return only one of each set of
+            results that differ by an automorphism of the motif (for example,
+            one result per triangle in the host rather than six). Motif
+            automorphisms must preserve node and edge attributes, so custom
+            match functions should not tell apart nodes or edges with equal
+            attributes. Hints that conflict with this choice yield nothing.
 
     Returns:
         Generator[dict, None, None]
@@ -399,32 +835,195 @@ def find_motifs_iter(
         else:
             directed = False
 
+    # The motif is fixed for the duration of the search, so precompute the
+    # lookups that get_next_backbone_candidates would otherwise rebuild:
+    motif_index = _MotifIndex(motif, interestingness, directed)
+
+    # The default attribute check passes every host node for a motif node that
+    # has no attributes, so those motif nodes skip it entirely:
+    unattributed_nodes = set()
+    if is_node_attr_match is _is_node_attr_match:
+        unattributed_nodes = {n for n, attrs in motif.nodes(data=True) if not attrs}
+    # Likewise for edges, when no motif edge has attributes:
+    check_edge_attrs = is_edge_attr_match is not _is_edge_attr_match or any(
+        attrs for _, _, attrs in motif.edges(data=True)
+    )
+
+    # Each (motif, host) pair of nodes or edges may be compared many times over
+    # the course of the search, from different partial backbones. Remember the
+    # results of the match functions for the lifetime of this search only, so
+    # that nothing holds on to graphs from earlier calls. Node results are kept
+    # in one table per motif node, which the candidate filter reads directly:
+    is_edge_attr_match = (
+        lru_cache(maxsize=None)(is_edge_attr_match) if check_edge_attrs else None
+    )
+    node_checks = {}
+    for n in motif_index.nodes:
+        node_checks[n] = (is_node_attr_match, is_node_structural_match)
+        if n in unattributed_nodes:
+            node_checks[n] = (is_node_structural_match,)
+    node_matches = {
+        n: _NodeMatches(n, motif, host, node_checks[n]) for n in motif_index.nodes
+    }
+
+    # Neighborhood label filter: a host node can only take a motif node if it
+    # has enough neighbors that can take that motif node's attributed
+    # neighbors. With the default structural check, motif neighbors with equal
+    # attributes and degrees have the same requirements, so they are counted
+    # together; a custom structural check may tell them apart, so each is then
+    # counted on its own. Host neighbors are tested against the plain node
+    # matches above.
+    extension_node_matches = dict(node_matches)
+    if is_node_attr_match is _is_node_attr_match:
+        group_equal_neighbors = is_node_structural_match is _is_node_structural_match
+        degree_keys = [motif_index.degree]
+        directions = [(motif_index.succ, host._adj)]
+        if directed:
+            degree_keys += [motif_index.in_degree, motif_index.out_degree]
+            directions.append((motif_index.strict_pred, host._pred))
+
+        def has_same_requirements(u, v):
+            return motif.nodes[u] == motif.nodes[v] and all(
+                degrees[u] == degrees[v] for degrees in degree_keys
+            )
+
+        for n in motif_index.nodes:
+            groups = []
+            for motif_neighbors, host_adjacency in directions:
+                counts = {}
+                for neighbor in motif_neighbors[n]:
+                    if neighbor in unattributed_nodes or neighbor == n:
+                        continue
+                    for other in counts if group_equal_neighbors else ():
+                        if has_same_requirements(neighbor, other):
+                            counts[other] += 1
+                            break
+                    else:
+                        counts[neighbor] = 1
+                groups.extend(
+                    (host_adjacency, neighbor, count)
+                    for neighbor, count in counts.items()
+                )
+            if groups:
+                extension_node_matches[n] = _NodeMatches(
+                    n,
+                    motif,
+                    host,
+                    node_checks[n] + (_neighbor_label_check(groups, node_matches),),
+                )
+
     # List of starting paths, defaults to searching all instances if hints is empty
     paths = hints if hints else [{}]
 
-    # Graph path traversal function
-    def walk(path):
+    # Host nodes that may be assigned to the seed node. These are the same for
+    # every path that starts from an empty backbone, so filter the host once
+    # (on first use) and try the best-connected candidates first:
+    seed_candidates = None
+
+    def candidates(mapping, used, node):
+        nonlocal seed_candidates
+        if not mapping:
+            if seed_candidates is None:
+                seed_candidates = sorted(
+                    _seed_candidates(
+                        node,
+                        motif,
+                        host,
+                        is_node_structural_match,
+                        None if node in unattributed_nodes else is_node_attr_match,
+                        motif_index,
+                    ),
+                    key=host.degree.__getitem__,
+                    reverse=True,
+                )
+                if extension_node_matches[node] is not node_matches[node]:
+                    seed_candidates = [
+                        c for c in seed_candidates if extension_node_matches[node][c]
+                    ]
+            return iter(seed_candidates)
+        return _extension_candidates(
+            mapping,
+            used,
+            node,
+            host,
+            directed,
+            extension_node_matches[node],
+            motif_index,
+        )
+
+    # Optionally, require the host images of symmetric motif nodes to follow
+    # the host's node order, so that only one of each set of equivalent
+    # results is found. Each constraint is checked when the later of its two
+    # nodes is assigned:
+    if break_symmetry:
+        host_rank = {n: i for i, n in enumerate(host)}
+        symmetry_constraints_at = {n: [] for n in motif}
+        for u, v in _symmetry_breaking_constraints(motif, interestingness):
+            symmetry_constraints_at[u].append((u, v))
+            symmetry_constraints_at[v].append((u, v))
+
+        def is_canonical(mapping, nodes):
+            return all(
+                host_rank[mapping[u]] < host_rank[mapping[v]]
+                for n in nodes
+                for u, v in symmetry_constraints_at[n]
+                if u in mapping and v in mapping
+            )
+
+    for path in paths:
+        if break_symmetry and not is_canonical(path, path):
+            continue
+        # Hints are checked up front, since the search only checks the nodes
+        # and edges of each node as it is placed:
+        if not all(node_matches[m][h] for m, h in path.items()):
+            continue
+        if not _is_valid_mapping(
+            path, motif, host, is_edge_attr_match, isomorphisms_only, motif_index
+        ):
+            continue
         if path and len(path) == len(motif):
             # Path complete
             yield path
-        else:
-            # Iterate over path candidates
-            for candidate in get_next_backbone_candidates(
-                path,
+            continue
+
+        # Depth-first traversal that extends a single mapping in place and
+        # undoes each assignment on backtrack, rather than copying the whole
+        # backbone into a new dict for every candidate. Each level of the
+        # stack holds the motif node being assigned at that depth and the
+        # not-yet-tried host candidates for it.
+        mapping = dict(path)
+        used = set(mapping.values())
+        node = motif_index.next_node(mapping) if mapping else motif_index.seed_node
+        stack = [(node, candidates(mapping, used, node))]
+        while stack:
+            node, level = stack[-1]
+            if node in mapping:
+                # Undo the previous sibling's assignment at this depth.
+                used.discard(mapping.pop(node))
+            c = next(level, None)
+            if c is None:
+                # This level is exhausted; backtrack.
+                stack.pop()
+                continue
+            mapping[node] = c
+            used.add(c)
+            if break_symmetry and not is_canonical(mapping, (node,)):
+                continue
+            if not _is_valid_extension(
+                mapping,
+                node,
                 motif,
                 host,
-                interestingness,
-                directed=directed,
-                isomorphisms_only=isomorphisms_only,
-                is_node_structural_match=is_node_structural_match,
-                is_node_attr_match=is_node_attr_match,
-                is_edge_attr_match=is_edge_attr_match,
+                is_edge_attr_match,
+                isomorphisms_only,
+                motif_index,
             ):
-                yield from walk(candidate)
-
-    # Traverse graph and yield mappings
-    for path in paths:
-        yield from walk(path)
+                continue
+            if len(mapping) == len(motif):
+                yield dict(mapping)
+            else:
+                node = motif_index.next_node(mapping)
+                stack.append((node, candidates(mapping, used, node)))
 
 
 def find_motifs(
@@ -461,9 +1060,7 @@ def find_motifs(
         List[dict]: A list of mappings from motif node IDs to host graph IDs
 
     """
-    results = []
-    results_count = 0
-    for qresult in find_motifs_iter(
+    results = find_motifs_iter(
         motif,
         host,
         *args,
@@ -471,23 +1068,157 @@ def find_motifs(
         is_node_structural_match=is_node_structural_match,
         is_edge_attr_match=is_edge_attr_match,
         **kwargs,
-    ):
+    )
+    if limit:
+        # Stop the search as soon as the limit is reached, rather than
+        # finding one more result to discover that it has been:
+        results = itertools.islice(results, limit)
+
+    if count_only:
+        # Count without holding on to the mappings themselves:
+        return sum(1 for _ in results)
+    return list(results)
+
+
+# The (motif, host, search arguments) triple for the current worker process of
+# `find_motifs_parallel`. This is set once per worker by the pool initializer,
+# so that the graphs are not pickled again for every task.
+_parallel_search = None
+
+
+def _init_parallel_worker(motif: nx.Graph, host: nx.Graph, kwargs: dict):
+    """
+    Store the search for this worker process of `find_motifs_parallel`.
+
+    Arguments:
+        motif (nx.Graph): The motif graph
+        host (nx.Graph): The host graph
+        kwargs (dict): The remaining arguments to pass to `find_motifs`
+
+    Returns:
+        None
+
+    """
+    global _parallel_search
+    _parallel_search = (motif, host, kwargs)
+
+
+def _find_motifs_from_roots(roots: List[dict]) -> Union[int, List[dict]]:
+    """
+    Run this worker's search from a chunk of search roots.
+
+    Arguments:
+        roots (List[dict]): Partial mappings to use as hints for the search
+
+    Returns:
+        int: If `count_only` is set, the number of results from these roots.
+        List[dict]: Otherwise, the mappings found from these roots
+
+    """
+    motif, host, kwargs = _parallel_search
+    return find_motifs(motif, host, hints=roots, **kwargs)
 
-        result = qresult
 
-        results_count += 1
-        if limit and results_count >= limit:
+def find_motifs_parallel(
+    motif: nx.Graph,
+    host: nx.Graph,
+    *,
+    count_only: bool = False,
+    limit: int = None,
+    processes: int = None,
+    chunksize: int = None,
+    **kwargs,
+) -> Union[int, List[dict]]:
+    """
+    Get a list of mappings from motif node IDs to host graph IDs, in parallel.
+
+    The search is split at its first level: each host node that may be assigned
+    to the first motif node roots an independent subtree of the search, and
+    these subtrees are explored in a pool of worker processes. Results are the
+    same as those of `find_motifs`, but are not returned in a stable order.
+
+    Custom match functions must be picklable (i.e. defined at module level).
+
+    See grandiso#find_motifs_iter for full argument list.
+
+    Arguments:
+        count_only (bool: False): If True, return only an integer count of the
+            number of motifs, rather than a list of mappings.
+        limit (int: None): A limit to place on the number of returned mappings.
+            The search will terminate once the limit is reached.
+        processes (int: None): The number of worker processes to use. Defaults
+            to the number of CPUs.
+        chunksize (int: None): The number of search roots to send to a worker
+            process at a time. Defaults to about four chunks per process.
+
+    Returns:
+        int: If `count_only` is True, return the length of the List.
+        List[dict]: A list of mappings from motif node IDs to host graph IDs
+
+    """
+    # Imported here so that serial searches don't pay for it at import time:
+    import multiprocessing
+
+    processes = processes or multiprocessing.cpu_count()
+    hints = kwargs.pop("hints", None)
+    if hints:
+        roots = list(hints)
+    else:
+        interestingness = kwargs.get("interestingness")
+        interestingness = interestingness or uniform_node_interestingness(motif)
+        directed = kwargs.get("directed")
+        if directed is None:
+            directed = isinstance(motif, nx.DiGraph)
+        motif_index = _MotifIndex(motif, interestingness, directed)
+        match_functions = {
+            name: kwargs[name]
+            for name in (
+                "is_node_structural_match",
+                "is_node_attr_match",
+                "is_edge_attr_match",
+            )
+            if name in kwargs
+        }
+
+        def expand(backbone):
+            return get_next_backbone_candidates(
+                backbone,
+                motif,
+                host,
+                interestingness,
+                directed=directed,
+                isomorphisms_only=kwargs.get("isomorphisms_only", False),
+                motif_index=motif_index,
+                **match_functions,
+            )
+
+        roots = list(expand({}))
+        # A small or very selective host may have too few starting nodes to
+        # keep every worker busy, so split each subtree one level further:
+        if len(roots) < 10 * processes and len(motif) > 1:
+            roots = [backbone for root in roots for backbone in expand(root)]
+
+    results = []
+    results_count = 0
+    chunksize = chunksize or max(1, len(roots) // (processes * 4))
+    chunks = [roots[i : i + chunksize] for i in range(0, len(roots), chunksize)]
+    if not chunks:
+        return results_count if count_only else results
+
+    kwargs = {**kwargs, "count_only": count_only, "limit": limit}
+    with multiprocessing.Pool(
+        processes, initializer=_init_parallel_worker, initargs=(motif, host, kwargs)
+    ) as pool:
+        for partial in pool.imap_unordered(_find_motifs_from_roots, chunks):
             if count_only:
-                return results_count
+                results_count += partial
             else:
-                # Subtract 1 from results_count because we have not yet
-                # added the new result to the results list, but we HAVE
-                # already added +1 to the count.
-                if limit and (results_count - 1) >= limit:
-                    return results
-        if not count_only:
-            results.append(result)
+                results.extend(partial)
+                results_count = len(results)
+            if limit and results_count >= limit:
+                # Leaving the `with` block terminates the outstanding workers.
+                break
 
     if count_only:
-        return results_count
-    return results
+        return min(results_count, limit) if limit else results_count
+    return results[:limit] if limit else results
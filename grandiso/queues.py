@@ -1,14 +1,8 @@
 from collections import deque
-import queue
+from queue import SimpleQueue
 from enum import Enum
 
 
-try:
-    SimpleQueue = queue.SimpleQueue
-except ImportError:
-    SimpleQueue = queue.Queue
-
-
 class QueuePolicy(Enum):
     """
     An Enum for queue pop policy.
@@ -33,38 +27,70 @@ class ProfilingQueue(SimpleQueue):
 
     """
 
-    def __init__(self):
+    def __init__(self, maxlen: int = None, sample_every: int = 1, record: bool = True):
         """
         Create a new ProfilingQueue.
 
         Arguments:
-            None
+            maxlen (int: None): The number of size samples to keep. Older
+                samples are discarded. Defaults to keeping all samples.
+            sample_every (int: 1): Record the size of the queue once every
+                `sample_every` puts and gets, to reduce overhead on long runs.
+            record (bool: True): Whether to record sizes at all. If False,
+                puts and gets go straight to the underlying queue.
 
         Returns:
             None
 
         """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be at least 1, got {sample_every}.")
         super(ProfilingQueue, self).__init__()
-        self._size_history = SimpleQueue()
+        self._put = super(ProfilingQueue, self).put
+        self._get = super(ProfilingQueue, self).get
+        if not record:
+            self.put = self._put
+            self.get = self._get
+        self._size_history = deque(maxlen=maxlen)
+        self._sample_every = sample_every
+        self._operations = 0
         self._size = 0
 
-    def put(self, *args, **kwargs):
+    def _record_size(self):
+        self._operations += 1
+        if self._operations % self._sample_every == 0:
+            self._size_history.append(self._size)
+
+    @property
+    def size_history(self) -> list:
+        """
+        Get the recorded sizes of the queue, oldest first.
+
+        Arguments:
+            None
+
+        Returns:
+            list: The size of the queue after each sampled put or get
+
+        """
+        return list(self._size_history)
+
+    def put(self, item, block: bool = True, timeout: float = None):
         """
         Put a new element into the queue.
 
         Arguments:
-            element: The element to add to the queue
+            item: The element to add to the queue
 
         Returns:
             None
 
         """
-        res = super(ProfilingQueue, self).put(*args, **kwargs)
+        self._put(item, block, timeout)
         self._size += 1
-        self._size_history.put(self._size)
-        return res
+        self._record_size()
 
-    def get(self, *args, **kwargs):
+    def get(self, block: bool = True, timeout: float = None):
         """
         Get a new item from the queue.
 
@@ -75,9 +101,9 @@ class ProfilingQueue(SimpleQueue):
             Any: The element popped from the queue
 
         """
-        res = super(ProfilingQueue, self).get(*args, **kwargs)
+        res = self._get(block, timeout)
         self._size -= 1
-        self._size_history.put(self._size)
+        self._record_size()
         return res
 
 
@@ -85,6 +111,9 @@ class Deque:
     """
     A double-ended queue implementation.
 
+    `put` and `get` accept the same arguments as `SimpleQueue`'s, but never
+    block: `block` and `timeout` are ignored.
+
     """
 
     def __init__(self, policy: QueuePolicy = QueuePolicy.DEPTHFIRST):
@@ -100,27 +129,26 @@ class Deque:
 
         """
         self._dq = deque()
+        self._put = self._dq.append
         if policy == QueuePolicy.DEPTHFIRST:
-            self._put = self._dq.append
             self._get = self._dq.popleft
         elif policy == QueuePolicy.BREADTHFIRST:
             self._get = self._dq.pop
-            self._put = self._dq.append
 
-    def put(self, *args, **kwargs):
+    def put(self, item, block: bool = True, timeout: float = None):
         """
         Put a new element into the queue.
 
         Arguments:
-            element: The element to add to the queue
+            item: The element to add to the queue
 
         Returns:
             None
 
         """
-        return self._put(args[0])
+        self._put(item)
 
-    def get(self, *args, **kwargs):
+    def get(self, block: bool = True, timeout: float = None):
         """
         Get a new item from the queue.
 
@@ -144,4 +172,30 @@ class Deque:
             bool: True if the queue has nothing more to pop
 
         """
-        return False if self._dq else True
+        return not self._dq
+
+    def __bool__(self):
+        """
+        Returns True if the queue has elements left to pop.
+
+        Arguments:
+            None
+
+        Returns:
+            bool: True if the queue is not empty
+
+        """
+        return bool(self._dq)
+
+    def __len__(self):
+        """
+        Get the number of elements in the queue.
+
+        Arguments:
+            None
+
+        Returns:
+            int: The number of elements in the queue
+
+        """
+        return len(self._dq)
@@ -1,363 +1,223 @@
+from functools import lru_cache
 import random
 import pytest
 
 import networkx as nx
 from networkx.algorithms.isomorphism import DiGraphMatcher, GraphMatcher
 
-from . import find_motifs, find_motifs_iter
+from . import (
+    find_motifs,
+    find_motifs_iter,
+    find_motifs_parallel,
+    get_next_backbone_candidates,
+    uniform_node_interestingness,
+)
+
+
+@lru_cache(maxsize=None)
+def _gnp_host(p, directed, n=10):
+    # Seeded and shared between tests, so tests must not modify it:
+    return nx.fast_gnp_random_graph(n, p, seed=0, directed=directed)
+
+
+# Motifs whose match counts are compared against networkx, by host density and
+# size. The complete host is kept small: every ordered 5-tuple of its nodes matches.
+_count_cases = [
+    pytest.param([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")], 0.5, 10, id="rect"),
+    pytest.param([("A", "B"), ("B", "C"), ("C", "A")], 0.5, 10, id="tri"),
+    pytest.param([("A", "B"), ("B", "C")], 0.5, 10, id="two_hop"),
+    pytest.param(
+        [("A", "B"), ("A", "C"), ("A", "D"), ("A", "E")],
+        1,
+        7,
+        id="high_degree_high_density",
+    ),
+    pytest.param(
+        [("A", "B"), ("A", "C"), ("A", "D"), ("A", "E")],
+        0.3,
+        10,
+        id="high_degree_low_density",
+    ),
+]
 
 
 class TestSubgraphMatching:
     def test_finds_no_triangles_in_zero_tri_graph(self):
 
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "A")
+        motif = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "A")])
 
-        host = nx.DiGraph()
-        host.add_edge("A", "B")
-        host.add_edge("B", "C")
+        host = nx.DiGraph([("A", "B"), ("B", "C")])
 
-        assert len(list(find_motifs_iter(motif, host))) == 0
+        assert sum(1 for _ in find_motifs_iter(motif, host)) == 0
 
     def test_finds_no_rect_in_zero_rect_graph(self):
 
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "D")
-        motif.add_edge("D", "A")
+        motif = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
 
-        host = nx.DiGraph()
-        host.add_edge("A", "B")
-        host.add_edge("B", "C")
-        host.add_edge("C", "D")
+        host = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "D")])
 
-        assert len(find_motifs(motif, host)) == 0
+        assert find_motifs(motif, host, count_only=True) == 0
 
     def test_finds_no_triangles_in_zero_tri_graph_with_context(self):
 
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "A")
-        motif.add_edge("C", "D")
-        motif.add_edge("C", "E")
+        motif = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("C", "E")])
 
-        host = nx.DiGraph()
-        host.add_edge("A", "B")
-        host.add_edge("B", "C")
+        host = nx.DiGraph([("A", "B"), ("B", "C")])
 
-        assert len(list(find_motifs_iter(motif, host))) == 0
+        assert sum(1 for _ in find_motifs_iter(motif, host)) == 0
 
     def test_finds_no_motifs_in_small_graph(self):
 
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
+        motif = nx.DiGraph([("A", "B"), ("B", "C")])
 
-        host = nx.DiGraph()
-        host.add_edge("A", "B")
+        host = nx.DiGraph([("A", "B")])
 
-        assert len(find_motifs(motif, host)) == 0
+        assert find_motifs(motif, host, count_only=True) == 0
 
     def test_subgraph_equals_graph_triangle(self):
 
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "A")
+        motif = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "A")])
 
-        host = nx.DiGraph()
-        host.add_edge("A", "B")
-        host.add_edge("B", "C")
-        host.add_edge("C", "A")
+        host = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "A")])
 
         assert len(find_motifs(motif, host)) == 3
 
     def test_subgraph_equals_graph_triangle_count_only(self):
 
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "A")
+        motif = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "A")])
 
-        host = nx.DiGraph()
-        host.add_edge("A", "B")
-        host.add_edge("B", "C")
-        host.add_edge("C", "A")
+        host = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "A")])
 
         assert find_motifs(motif, host, count_only=True) == 3
 
     def test_subgraph_equals_graph_rect(self):
 
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "D")
-        motif.add_edge("D", "A")
-
-        host = nx.DiGraph()
-        host.add_edge("A", "B")
-        host.add_edge("B", "C")
-        host.add_edge("C", "D")
-        host.add_edge("D", "A")
-
-        assert len(find_motifs(motif, host)) == 4
-
-    def test_rect_count_matches_nx(self):
-
-        host = nx.fast_gnp_random_graph(10, 0.5, directed=True)
+        motif = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
 
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "D")
-        motif.add_edge("D", "A")
-
-        assert len(find_motifs(motif, host)) == len(
-            [i for i in DiGraphMatcher(host, motif).subgraph_monomorphisms_iter()]
-        )
-
-    def test_tri_count_matches_nx(self):
-
-        host = nx.fast_gnp_random_graph(10, 0.5, directed=True)
-
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "A")
-
-        assert find_motifs(motif, host, count_only=True) == len(
-            [i for i in DiGraphMatcher(host, motif).subgraph_monomorphisms_iter()]
-        )
+        host = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
 
-    def test_two_hop_count_matches_nx(self):
+        assert find_motifs(motif, host, count_only=True) == 4
 
-        host = nx.fast_gnp_random_graph(10, 0.5, directed=True)
+    @pytest.mark.parametrize("motif_edges,p,n", _count_cases)
+    def test_count_matches_nx(self, motif_edges, p, n):
+        host = _gnp_host(p, directed=True, n=n)
+        motif = nx.DiGraph(motif_edges)
 
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-
-        assert len(find_motifs(motif, host)) == len(
-            [i for i in DiGraphMatcher(host, motif).subgraph_monomorphisms_iter()]
+        assert find_motifs(motif, host, count_only=True) == sum(
+            1 for _ in DiGraphMatcher(host, motif).subgraph_monomorphisms_iter()
         )
 
-    def test_high_degree_high_density_count_matches_nx(self):
-
-        host = nx.fast_gnp_random_graph(10, 1, directed=True)
-
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("A", "C")
-        motif.add_edge("A", "D")
-        motif.add_edge("A", "E")
-
-        assert len(find_motifs(motif, host)) == len(
-            [i for i in DiGraphMatcher(host, motif).subgraph_monomorphisms_iter()]
-        )
+    def test_falsy_node_names(self):
 
-    def test_high_degree_low_density_count_matches_nx(self):
+        motif = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
 
-        host = nx.fast_gnp_random_graph(10, 0.3, directed=True)
+        host = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
 
-        motif = nx.DiGraph()
-        motif.add_edge("A", "B")
-        motif.add_edge("A", "C")
-        motif.add_edge("A", "D")
-        motif.add_edge("A", "E")
+        assert find_motifs(motif, host, count_only=True) == 3
 
-        assert len(find_motifs(motif, host)) == len(
-            [i for i in DiGraphMatcher(host, motif).subgraph_monomorphisms_iter()]
+    def test_seed_degree_check_with_directed_false(self):
+        # The first node must get the same in/out-degree check as every later
+        # node, even when the search itself is run as undirected:
+        motif = nx.DiGraph([("A", "B")])
+        host = nx.DiGraph([("x", "y")])
+        seeds = get_next_backbone_candidates(
+            {},
+            motif,
+            host,
+            uniform_node_interestingness(motif),
+            directed=False,
         )
-
-    def test_falsy_node_names(self):
-
-        motif = nx.DiGraph()
-        motif.add_edge(0, 1)
-        motif.add_edge(1, 2)
-        motif.add_edge(2, 0)
-
-        host = nx.DiGraph()
-        host.add_edge(0, 1)
-        host.add_edge(1, 2)
-        host.add_edge(2, 0)
-
-        assert len(find_motifs(motif, host)) == 3
+        assert list(seeds) == [{"A": "x"}]
 
 
 class TestUndirectedSubgraphMatching:
     def test_subgraph_equals_graph_triangle(self):
 
-        motif = nx.Graph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "A")
+        motif = nx.Graph([("A", "B"), ("B", "C"), ("C", "A")])
 
-        host = nx.Graph()
-        host.add_edge("A", "B")
-        host.add_edge("B", "C")
-        host.add_edge("C", "A")
+        host = nx.Graph([("A", "B"), ("B", "C"), ("C", "A")])
 
-        assert len(find_motifs(motif, host)) == 6
+        assert find_motifs(motif, host, count_only=True) == 6
 
     def test_subgraph_equals_graph_rect(self):
 
-        motif = nx.Graph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "D")
-        motif.add_edge("D", "A")
-
-        host = nx.Graph()
-        host.add_edge("A", "B")
-        host.add_edge("B", "C")
-        host.add_edge("C", "D")
-        host.add_edge("D", "A")
-
-        assert len(find_motifs(motif, host)) == 8
-
-    def test_rect_count_matches_nx(self):
-
-        host = nx.fast_gnp_random_graph(10, 0.5, directed=False)
-
-        motif = nx.Graph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "D")
-        motif.add_edge("D", "A")
-
-        assert len(find_motifs(motif, host)) == len(
-            [i for i in GraphMatcher(host, motif).subgraph_monomorphisms_iter()]
-        )
-
-    def test_tri_count_matches_nx(self):
-
-        host = nx.fast_gnp_random_graph(10, 0.5, directed=False)
-
-        motif = nx.Graph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-        motif.add_edge("C", "A")
-
-        assert len(find_motifs(motif, host)) == len(
-            [i for i in GraphMatcher(host, motif).subgraph_monomorphisms_iter()]
-        )
-
-    def test_two_hop_count_matches_nx(self):
+        motif = nx.Graph([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
 
-        host = nx.fast_gnp_random_graph(10, 0.5, directed=False)
+        host = nx.Graph([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
 
-        motif = nx.Graph()
-        motif.add_edge("A", "B")
-        motif.add_edge("B", "C")
-
-        assert len(find_motifs(motif, host)) == len(
-            [i for i in GraphMatcher(host, motif).subgraph_monomorphisms_iter()]
-        )
+        assert find_motifs(motif, host, count_only=True) == 8
 
-    def test_high_degree_high_density_count_matches_nx(self):
+    @pytest.mark.parametrize("motif_edges,p,n", _count_cases)
+    def test_count_matches_nx(self, motif_edges, p, n):
+        host = _gnp_host(p, directed=False, n=n)
+        motif = nx.Graph(motif_edges)
 
-        host = nx.fast_gnp_random_graph(10, 1, directed=False)
-
-        motif = nx.Graph()
-        motif.add_edge("A", "B")
-        motif.add_edge("A", "C")
-        motif.add_edge("A", "D")
-        motif.add_edge("A", "E")
-
-        assert len(find_motifs(motif, host)) == len(
-            [i for i in GraphMatcher(host, motif).subgraph_monomorphisms_iter()]
+        assert find_motifs(motif, host, count_only=True) == sum(
+            1 for _ in GraphMatcher(host, motif).subgraph_monomorphisms_iter()
         )
 
-    def test_high_degree_low_density_count_matches_nx(self):
-
-        host = nx.fast_gnp_random_graph(10, 0.3, directed=False)
-
-        motif = nx.Graph()
-        motif.add_edge("A", "B")
-        motif.add_edge("A", "C")
-        motif.add_edge("A", "D")
-        motif.add_edge("A", "E")
 
-        assert len(find_motifs(motif, host)) == len(
-            [i for i in GraphMatcher(host, motif).subgraph_monomorphisms_iter()]
-        )
-
-
-def _random_motif():
-    g = nx.graph_atlas(random.randint(7, 30))
-    while len([c for c in nx.connected_components(g)]) != 1:
-        g = nx.graph_atlas(random.randint(7, 30))
+def _random_motif(rng):
+    g = nx.graph_atlas(rng.randint(7, 30))
+    while not nx.is_connected(g):
+        g = nx.graph_atlas(rng.randint(7, 30))
     return nx.relabel_nodes(g, lambda x: str(x + 1))
 
 
-def _random_host(directed=False, n=20, p=0.1):
-    g = nx.fast_gnp_random_graph(n, p, directed=directed)
-    while (
-        len(
-            [
-                c
-                for c in (
-                    nx.weakly_connected_components(g)
-                    if directed
-                    else nx.connected_components(g)
-                )
-            ]
-        )
-        != 1
-    ):
-        g = nx.fast_gnp_random_graph(n, p, directed=directed)
+def _random_host(rng, directed=False, n=20, p=0.1):
+    is_connected = nx.is_weakly_connected if directed else nx.is_connected
+    g = nx.fast_gnp_random_graph(n, p, seed=rng, directed=directed)
+    while not is_connected(g):
+        g = nx.fast_gnp_random_graph(n, p, seed=rng, directed=directed)
     return nx.relabel_nodes(g, lambda x: str(x + 1))
 
 
-def _random_directed_motif():
-    motif = _random_motif()
+def _random_directed_motif(rng):
+    motif = _random_motif(rng)
     dmotif = nx.DiGraph()
     for u, v in motif.edges():
-        dmotif.add_edge(*random.choice([(u, v), (v, u)]))
+        dmotif.add_edge(*rng.choice([(u, v), (v, u)]))
     return dmotif
 
 
+def _random_host_and_motif(seed, directed=False):
+    # Built per test from its own seed, so that results are reproducible and
+    # graphs are only generated for the tests that actually run:
+    rng = random.Random(seed)
+    if directed:
+        return _random_host(rng, directed=True), _random_directed_motif(rng)
+    return _random_host(rng), _random_motif(rng)
+
+
 class TestRandomGraphIsomorphisms:
-    @pytest.mark.parametrize(
-        "host,motif",
-        [(_random_host(directed=False), _random_motif()) for _ in range(5)],
-    )
-    def test_isomorphisms_on_undirected_random_graph(self, host, motif):
-        assert find_motifs(motif, host, isomorphisms_only=True, count_only=True) == len(
-            [i for i in GraphMatcher(host, motif).subgraph_isomorphisms_iter()]
+    @pytest.mark.parametrize("seed", range(0, 5))
+    def test_isomorphisms_on_undirected_random_graph(self, seed):
+        host, motif = _random_host_and_motif(seed)
+        assert find_motifs(motif, host, isomorphisms_only=True, count_only=True) == sum(
+            1 for _ in GraphMatcher(host, motif).subgraph_isomorphisms_iter()
         )
 
-    @pytest.mark.parametrize(
-        "host,motif",
-        [(_random_host(directed=True), _random_directed_motif()) for _ in range(15)],
-    )
-    def test_isomorphisms_on_directed_random_graph(self, host, motif):
+    @pytest.mark.parametrize("seed", range(5, 20))
+    def test_isomorphisms_on_directed_random_graph(self, seed):
+        host, motif = _random_host_and_motif(seed, directed=True)
         assert find_motifs(
             motif, host, directed=True, isomorphisms_only=True, count_only=True
-        ) == len([i for i in DiGraphMatcher(host, motif).subgraph_isomorphisms_iter()])
+        ) == sum(1 for _ in DiGraphMatcher(host, motif).subgraph_isomorphisms_iter())
 
 
 class TestRandomGraphMonomorphisms:
-    @pytest.mark.parametrize(
-        "host,motif",
-        [(_random_host(directed=False), _random_motif()) for _ in range(5)],
-    )
-    def test_monomorphisms_on_undirected_random_graph(self, host, motif):
-        assert find_motifs(motif, host, count_only=True) == len(
-            [i for i in GraphMatcher(host, motif).subgraph_monomorphisms_iter()]
+    @pytest.mark.parametrize("seed", range(20, 25))
+    def test_monomorphisms_on_undirected_random_graph(self, seed):
+        host, motif = _random_host_and_motif(seed)
+        assert find_motifs(motif, host, count_only=True) == sum(
+            1 for _ in GraphMatcher(host, motif).subgraph_monomorphisms_iter()
         )
 
-    @pytest.mark.parametrize(
-        "host,motif",
-        [(_random_host(directed=True), _random_directed_motif()) for _ in range(15)],
-    )
-    def test_monomorphisms_on_directed_random_graph(self, host, motif):
-        assert find_motifs(motif, host, directed=True, count_only=True) == len(
-            [i for i in DiGraphMatcher(host, motif).subgraph_monomorphisms_iter()]
+    @pytest.mark.parametrize("seed", range(25, 40))
+    def test_monomorphisms_on_directed_random_graph(self, seed):
+        host, motif = _random_host_and_motif(seed, directed=True)
+        assert find_motifs(motif, host, directed=True, count_only=True) == sum(
+            1 for _ in DiGraphMatcher(host, motif).subgraph_monomorphisms_iter()
         )
 
 
@@ -372,13 +232,11 @@ class TestSubcliques:
 
 
 class TestHints:
-    @pytest.mark.parametrize(
-        "host,motif",
-        [(_random_host(directed=False), _random_motif()) for _ in range(5)],
-    )
-    def test_empty_hints(self, host, motif):
-        assert find_motifs(motif, host, count_only=True, hints=[]) == len(
-            [i for i in GraphMatcher(host, motif).subgraph_monomorphisms_iter()]
+    @pytest.mark.parametrize("seed", range(40, 45))
+    def test_empty_hints(self, seed):
+        host, motif = _random_host_and_motif(seed)
+        assert find_motifs(motif, host, count_only=True, hints=[]) == sum(
+            1 for _ in GraphMatcher(host, motif).subgraph_monomorphisms_iter()
         )
 
     def test_broken_hints_have_no_results(self):
@@ -393,6 +251,25 @@ class TestHints:
             find_motifs(motif, host, count_only=True, hints=[{"A": "A", "B": "C"}]) == 0
         )
 
+    def test_complete_hints_are_checked(self):
+        host = nx.DiGraph()
+        nx.add_path(host, ["A", "B", "C", "A"])
+        motif = nx.DiGraph()
+        nx.add_path(motif, ["a", "b", "c", "a"])
+        assert find_motifs(motif, host, hints=[{"a": "A", "b": "B", "c": "C"}]) == [
+            {"a": "A", "b": "B", "c": "C"}
+        ]
+        assert find_motifs(motif, host, hints=[{"a": "A", "b": "C", "c": "B"}]) == []
+
+    def test_complete_hints_check_node_attributes(self):
+        host = nx.DiGraph()
+        nx.add_path(host, ["A", "B", "C", "A"])
+        motif = nx.DiGraph()
+        nx.add_path(motif, ["a", "b", "c", "a"])
+        motif.add_node("a", flavor="x")
+        assert find_motifs(motif, host, hints=[{"a": "A"}]) == []
+        assert find_motifs(motif, host, hints=[{"a": "A", "b": "B", "c": "C"}]) == []
+
     def test_some_hints_have_values(self):
         # One mapping will fail, the other is valid:
         host = nx.DiGraph()
@@ -443,11 +320,54 @@ class TestLimits:
         assert find_motifs(motif, host, count_only=True, limit=338) == 336
 
 
+class TestSymmetryBreaking:
+    def test_one_result_per_clique(self):
+        host = nx.complete_graph(8)
+        motif = nx.complete_graph(3)
+        assert find_motifs(motif, host, count_only=True, break_symmetry=True) == 56
+
+    @pytest.mark.parametrize("isomorphisms_only", [False, True])
+    def test_counts_scale_by_automorphisms(self, isomorphisms_only):
+        host = nx.fast_gnp_random_graph(20, 0.3, directed=True, seed=2)
+        motif = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
+        automorphisms = sum(1 for _ in DiGraphMatcher(motif, motif).isomorphisms_iter())
+        full = find_motifs(
+            motif, host, count_only=True, isomorphisms_only=isomorphisms_only
+        )
+        reduced = find_motifs(
+            motif,
+            host,
+            count_only=True,
+            isomorphisms_only=isomorphisms_only,
+            break_symmetry=True,
+        )
+        assert reduced * automorphisms == full
+
+    def test_attributes_break_symmetry(self):
+        host = nx.complete_graph(6)
+        for n in host.nodes:
+            host.nodes[n]["color"] = "red" if n < 3 else "blue"
+        motif = nx.Graph()
+        motif.add_node("A", color="red")
+        motif.add_node("B", color="blue")
+        motif.add_node("C", color="blue")
+        motif.add_edges_from([("A", "B"), ("B", "C"), ("C", "A")])
+        # Only B and C are interchangeable:
+        assert find_motifs(motif, host, count_only=True) == 18
+        assert find_motifs(motif, host, count_only=True, break_symmetry=True) == 9
+
+    def test_large_star(self):
+        # A 12-leaf star has 12! automorphisms, which must not be listed:
+        host = nx.star_graph(13)
+        motif = nx.star_graph(12)
+        assert find_motifs(motif, host, count_only=True, break_symmetry=True) == 13
+
+
 class TestIterator:
     def test_zero_limit(self):
         host = nx.complete_graph(8)
         motif = nx.complete_graph(3)
-        assert len(list(find_motifs_iter(motif, host))) == 336
+        assert sum(1 for _ in find_motifs_iter(motif, host)) == 336
 
     def test_can_get_next_result(self):
         host = nx.complete_graph(8)
@@ -462,13 +382,49 @@ class TestIterator:
             next(find_motifs_iter(motif, host, hints=[{"F": "X"}]))
 
 
+class TestParallel:
+    def test_matches_serial(self):
+        host = nx.fast_gnp_random_graph(30, 0.3, directed=True, seed=1)
+        motif = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "A")])
+        serial = find_motifs(motif, host)
+        parallel = find_motifs_parallel(motif, host, processes=2, chunksize=4)
+        assert sorted(map(sorted, map(dict.items, parallel))) == sorted(
+            map(sorted, map(dict.items, serial))
+        )
+
+    def test_count_only(self):
+        host = nx.complete_graph(8)
+        motif = nx.complete_graph(3)
+        assert find_motifs_parallel(motif, host, processes=2, count_only=True) == 336
+
+    def test_limit(self):
+        host = nx.complete_graph(8)
+        motif = nx.complete_graph(3)
+        assert len(find_motifs_parallel(motif, host, processes=2, limit=10)) == 10
+
+    def test_no_roots(self):
+        host = nx.path_graph(8)
+        motif = nx.complete_graph(3)
+        assert find_motifs_parallel(motif, host, processes=2) == []
+
+    def test_options_are_keyword_only(self):
+        host = nx.complete_graph(8)
+        motif = nx.complete_graph(3)
+        with pytest.raises(TypeError):
+            find_motifs_parallel(motif, host, {0: 1, 1: 1, 2: 1})
+
+
 class TestAttributes:
     def test_node_attributes(self):
         host = nx.DiGraph()
         nx.add_path(host, ["A", "B", "C", "A"])
-        host.add_node("A", flavor="chocolate")
-        host.add_node("B", flavor="coffee")
-        host.add_node("C", flavor="lint")
+        host.add_nodes_from(
+            [
+                ("A", {"flavor": "chocolate"}),
+                ("B", {"flavor": "coffee"}),
+                ("C", {"flavor": "lint"}),
+            ]
+        )
 
         motif = nx.DiGraph()
         nx.add_path(motif, ["a", "b", "c", "a"])
@@ -477,11 +433,13 @@ class TestAttributes:
         assert find_motifs(motif, host, count_only=True) == 1
 
     def test_edge_attributes(self):
-        host = nx.DiGraph()
-        nx.add_path(host, ["A", "B", "C", "A"])
-        host.add_edge("A", "B", flavor="chocolate")
-        host.add_edge("B", "C", flavor="coffee")
-        host.add_edge("C", "A", flavor="lint")
+        host = nx.DiGraph(
+            [
+                ("A", "B", {"flavor": "chocolate"}),
+                ("B", "C", {"flavor": "coffee"}),
+                ("C", "A", {"flavor": "lint"}),
+            ]
+        )
 
         motif = nx.DiGraph()
         nx.add_path(motif, ["a", "b", "c", "a"])
@@ -490,14 +448,20 @@ class TestAttributes:
         assert find_motifs(motif, host) == [{"a": "A", "b": "B", "c": "C"}]
 
     def test_node_and_edge_attributes(self):
-        host = nx.DiGraph()
-        nx.add_path(host, ["A", "B", "C", "A"])
-        host.add_edge("A", "B", flavor="chocolate")
-        host.add_edge("B", "C", flavor="coffee")
-        host.add_edge("C", "A", flavor="lint")
-        host.add_node("A", flavor="chocolate")
-        host.add_node("B", flavor="coffee")
-        host.add_node("C", flavor="lint")
+        host = nx.DiGraph(
+            [
+                ("A", "B", {"flavor": "chocolate"}),
+                ("B", "C", {"flavor": "coffee"}),
+                ("C", "A", {"flavor": "lint"}),
+            ]
+        )
+        host.add_nodes_from(
+            [
+                ("A", {"flavor": "chocolate"}),
+                ("B", {"flavor": "coffee"}),
+                ("C", {"flavor": "lint"}),
+            ]
+        )
 
         motif = nx.DiGraph()
         nx.add_path(motif, ["a", "b", "c", "a"])
@@ -506,18 +470,66 @@ class TestAttributes:
 
         assert find_motifs(motif, host) == []
 
+    def test_repeated_neighbor_attributes(self):
+        # The center of the motif needs two distinct "leaf" neighbors, which
+        # only host node 0 has:
+        host = nx.Graph([(0, 1), (0, 2), (0, 3), (4, 5), (4, 6)])
+        for n, kind in [(1, "leaf"), (2, "leaf"), (3, "other"), (5, "leaf")]:
+            host.add_node(n, kind=kind)
+        host.add_node(6, kind="other")
+
+        motif = nx.Graph([("center", "x"), ("center", "y"), ("center", "z")])
+        motif.add_node("x", kind="leaf")
+        motif.add_node("y", kind="leaf")
+        motif.add_node("z", kind="other")
+
+        assert find_motifs(motif, host, count_only=True) == 2
+        assert {r["center"] for r in find_motifs(motif, host)} == {0}
+
+    def test_repeated_neighbor_attributes_custom_structural_match(self):
+        # x and y have equal attributes, but a custom structural match tells
+        # them apart, so they may not be counted as one group of neighbors:
+        host = nx.Graph([(0, 1), (0, 2)])
+        nx.set_node_attributes(host, {1: "leaf", 2: "leaf"}, "kind")
+        motif = nx.Graph([("c", "x"), ("c", "y")])
+        nx.set_node_attributes(motif, {"x": "leaf", "y": "leaf"}, "kind")
+
+        def is_node_structural_match(motif_node_id, host_node_id, motif, host):
+            parity = {"x": 0, "y": 1}.get(motif_node_id)
+            return parity is None or host_node_id % 2 == parity
+
+        assert find_motifs(
+            motif, host, is_node_structural_match=is_node_structural_match
+        ) == [{"c": 0, "x": 2, "y": 1}]
+
+    def test_node_attr_match_is_memoized(self):
+        # Each (motif node, host node) pair is checked at most once per search:
+        calls = []
+
+        def is_node_attr_match(motif_node_id, host_node_id, motif, host):
+            calls.append((motif_node_id, host_node_id))
+            return (
+                motif.nodes[motif_node_id]["kind"] == host.nodes[host_node_id]["kind"]
+            )
+
+        host = nx.complete_graph(12)
+        nx.set_node_attributes(host, {n: n % 3 for n in host}, "kind")
+        motif = nx.complete_graph(3)
+        nx.set_node_attributes(motif, {n: n for n in motif}, "kind")
+
+        assert (
+            find_motifs(
+                motif, host, count_only=True, is_node_attr_match=is_node_attr_match
+            )
+            == 4 * 4 * 4
+        )
+        assert len(calls) == len(set(calls))
+
     def test_attr_not_in_node(self):
         host = nx.DiGraph()
         nx.add_path(host, ["A", "B", "C", "A"])
-        host.add_edge("A", "B")
-        host.add_edge("B", "C")
-        host.add_edge("C", "A")
-        host.add_node("A")
-        host.add_node("B")
-        host.add_node("C")
 
-        motif = nx.DiGraph()
-        motif.add_edge("a", "b")
+        motif = nx.DiGraph([("a", "b")])
         motif.add_node("a", flavor="coffee")
 
         assert find_motifs(motif, host) == []
@@ -525,12 +537,6 @@ class TestAttributes:
     def test_attr_not_in_edge(self):
         host = nx.DiGraph()
         nx.add_path(host, ["A", "B", "C", "A"])
-        host.add_edge("A", "B")
-        host.add_edge("B", "C")
-        host.add_edge("C", "A")
-        host.add_node("A")
-        host.add_node("B")
-        host.add_node("C")
 
         motif = nx.DiGraph()
         motif.add_edge("a", "b", type="delicious")
@@ -41,6 +41,19 @@ def test_can_put_and_pop(queue, queue_args):
     assert q.empty()
 
 
+@pytest.mark.parametrize(
+    "queue,queue_args",
+    all_queues,
+)
+def test_simple_queue_arguments(queue, queue_args):
+    q = queue(*queue_args)
+    q.put(1, True)
+    q.put(2, block=True, timeout=None)
+    assert q.get(False) in (1, 2)
+    assert q.get(block=True, timeout=None) in (1, 2)
+    assert q.empty()
+
+
 def test_bfs_dfs():
     bfs = Deque(QueuePolicy.BREADTHFIRST)
     dfs = Deque(QueuePolicy.DEPTHFIRST)
@@ -52,3 +65,32 @@ def test_bfs_dfs():
 
     assert bfs.get() == 2
     assert dfs.get() == 1
+    assert bfs and len(dfs) == 1
+    bfs.get()
+    assert not bfs
+
+
+def test_profiling_queue_size_history():
+    q = ProfilingQueue()
+    q.put(1)
+    q.put(2)
+    q.get()
+    assert q.size_history == [1, 2, 1]
+
+    q = ProfilingQueue(maxlen=2, sample_every=2)
+    for i in range(6):
+        q.put(i)
+    assert q.size_history == [4, 6]
+
+
+def test_profiling_queue_without_recording():
+    q = ProfilingQueue(record=False)
+    q.put(1)
+    q.put(2)
+    assert q.get() == 1
+    assert q.size_history == []
+
+
+def test_profiling_queue_rejects_zero_sample_every():
+    with pytest.raises(ValueError):
+        ProfilingQueue(sample_every=0)
@@ -17,5 +17,6 @@ setuptools.setup(
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
     ],
+    python_requires=">=3.7",
     install_requires=["networkx>=2.5.1"],
 )